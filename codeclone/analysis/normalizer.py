@@ -29,11 +29,25 @@ class NormalizationConfig:
 
 
 class AstNormalizer(ast.NodeTransformer):
-    __slots__ = ("cfg",)
+    __slots__ = (
+        "_ignore_docstrings",
+        "_ignore_type_annotations",
+        "_normalize_attributes",
+        "_normalize_constants",
+        "_normalize_names",
+        "cfg",
+    )
 
     def __init__(self, cfg: NormalizationConfig):
         super().__init__()
         self.cfg = cfg
+        # Visitors run once per AST node; read the config flags from the
+        # normalizer itself instead of through ``self.cfg`` each time.
+        self._ignore_docstrings = cfg.ignore_docstrings
+        self._ignore_type_annotations = cfg.ignore_type_annotations
+        self._normalize_attributes = cfg.normalize_attributes
+        self._normalize_constants = cfg.normalize_constants
+        self._normalize_names = cfg.normalize_names
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
         return self._visit_func(node)
@@ -43,7 +57,7 @@ class AstNormalizer(ast.NodeTransformer):
 
     def _visit_func(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> ast.AST:
         # Drop docstring
-        if self.cfg.ignore_docstrings and node.body:
+        if self._ignore_docstrings and node.body:
             first = node.body[0]
             if (
                 isinstance(first, ast.Expr)
@@ -52,7 +66,7 @@ class AstNormalizer(ast.NodeTransformer):
             ):
                 node.body = node.body[1:]
 
-        if self.cfg.ignore_type_annotations:
+        if self._ignore_type_annotations:
             node.returns = None
             args = node.args
 
@@ -70,25 +84,25 @@ class AstNormalizer(ast.NodeTransformer):
         return self.generic_visit(node)
 
     def visit_arg(self, node: ast.arg) -> ast.arg:
-        if self.cfg.ignore_type_annotations:
+        if self._ignore_type_annotations:
             node.annotation = None
         return node
 
     def visit_Name(self, node: ast.Name) -> ast.Name:
         # Call targets are handled in visit_Call to avoid erasing callee symbols.
-        if self.cfg.normalize_names and not _is_semantic_marker_name(node.id):
+        if self._normalize_names and not _is_semantic_marker_name(node.id):
             node.id = "_VAR_"
         return node
 
     def visit_Attribute(self, node: ast.Attribute) -> ast.Attribute:
         new_node = self.generic_visit(node)
         assert isinstance(new_node, ast.Attribute)
-        if self.cfg.normalize_attributes:
+        if self._normalize_attributes:
             new_node.attr = "_ATTR_"
         return new_node
 
     def visit_Constant(self, node: ast.Constant) -> ast.Constant:
-        if self.cfg.normalize_constants:
+        if self._normalize_constants:
             node.value = "_CONST_"
         return node
 
@@ -27,8 +27,10 @@ def diff_clone_groups(
     func_groups: Mapping[str, object],
     block_groups: Mapping[str, object],
 ) -> tuple[set[str], set[str]]:
-    new_funcs = set(func_groups.keys()) - known_functions
-    new_blocks = set(block_groups.keys()) - known_blocks
+    # Collect only the unknown keys; copying every current key into a set
+    # first would allocate a full-size set just to subtract from it.
+    new_funcs = {key for key in func_groups if key not in known_functions}
+    new_blocks = {key for key in block_groups if key not in known_blocks}
     return new_funcs, new_blocks
 
 
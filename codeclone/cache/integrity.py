@@ -13,9 +13,7 @@ from pathlib import Path
 
 from ..utils.json_io import json_text as _json_text
 from ..utils.json_io import read_json_document as _read_json_document
-from ..utils.json_io import (
-    write_json_document_atomically as _write_json_document_atomically,
-)
+from ..utils.json_io import write_json_text_atomically as _write_json_text_atomically
 
 
 def as_str_or_none(value: object) -> str | None:
@@ -42,11 +40,14 @@ def canonical_json(data: object) -> str:
     return _json_text(data, sort_keys=True)
 
 
-def sign_cache_payload(data: Mapping[str, object]) -> str:
-    canonical = canonical_json(data)
+def _sign_canonical_text(canonical: str) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+def sign_cache_payload(data: Mapping[str, object]) -> str:
+    return _sign_canonical_text(canonical_json(data))
+
+
 def verify_cache_payload_signature(
     payload: Mapping[str, object],
     signature: str,
@@ -60,8 +61,25 @@ def read_json_document(path: Path, *, max_bytes: int | None = None) -> object:
     return _read_json_document(path, max_bytes=max_bytes)
 
 
-def write_json_document_atomically(path: Path, document: object) -> None:
-    _write_json_document_atomically(path, document, sort_keys=True)
+def write_signed_cache_document(
+    path: Path,
+    *,
+    version: str,
+    payload: Mapping[str, object],
+) -> None:
+    """Write ``{"payload", "sig", "v"}`` serializing the payload only once.
+
+    The canonical payload text is both hashed and embedded verbatim; the
+    result is byte-identical to writing the full document with sorted keys.
+    """
+    canonical = canonical_json(payload)
+    text = (
+        f'{{"payload":{canonical},'
+        f'"sig":{_json_text(_sign_canonical_text(canonical))},'
+        f'"v":{_json_text(version)}}}'
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_text_atomically(path, text)
 
 
 __all__ = [
@@ -73,5 +91,5 @@ __all__ = [
     "read_json_document",
     "sign_cache_payload",
     "verify_cache_payload_signature",
-    "write_json_document_atomically",
+    "write_signed_cache_document",
 ]
@@ -72,9 +72,8 @@ from .integrity import (
 )
 from .integrity import (
     read_json_document,
-    sign_cache_payload,
     verify_cache_payload_signature,
-    write_json_document_atomically,
+    write_signed_cache_document,
 )
 from .projection import (
     SegmentReportProjection,
@@ -437,12 +436,9 @@ class Cache:
             )
             if segment_projection is not None:
                 payload["sr"] = segment_projection
-            signed_doc = {
-                "v": self._CACHE_VERSION,
-                "payload": payload,
-                "sig": sign_cache_payload(payload),
-            }
-            write_json_document_atomically(self.path, signed_doc)
+            write_signed_cache_document(
+                self.path, version=self._CACHE_VERSION, payload=payload
+            )
             self._dirty = False
 
             self.data["version"] = self._CACHE_VERSION
@@ -706,12 +702,15 @@ class Cache:
         return len(stale_runtime_paths)
 
 
-def file_stat_signature(path: str) -> FileStat:
-    stat_result = os.stat(path)
+def file_stat_from_result(stat_result: os.stat_result) -> FileStat:
     return FileStat(
         mtime_ns=stat_result.st_mtime_ns,
         size=stat_result.st_size,
     )
 
 
-__all__ = ["Cache", "file_stat_signature"]
+def file_stat_signature(path: str) -> FileStat:
+    return file_stat_from_result(os.stat(path))
+
+
+__all__ = ["Cache", "file_stat_from_result", "file_stat_signature"]
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import lru_cache
 from typing import NoReturn
 
 from .. import ui_messages as ui
@@ -84,7 +85,10 @@ def _add_option(
     group.add_argument(*option.flags, **argument_kwargs)  # type: ignore[arg-type]
 
 
+@lru_cache(maxsize=1)
 def build_parser(version: str) -> _ArgumentParser:
+    # parse_args() does not mutate the parser, so repeated in-process main()
+    # calls (tests, embedding hosts) can share one instance per version.
     parser = _ArgumentParser(
         prog="codeclone",
         description="Structural code quality analysis for Python.",
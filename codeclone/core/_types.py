@@ -48,7 +48,7 @@ if TYPE_CHECKING:
     from ..analysis.phase_ledger import PhaseSnapshot
 
 MAX_FILE_SIZE = 10 * 1024 * 1024
-DEFAULT_BATCH_SIZE = 100
+PARALLEL_CHUNKS_PER_WORKER = 4
 PARALLEL_MIN_FILES_PER_WORKER = 8
 PARALLEL_MIN_FILES_FLOOR = 16
 DEFAULT_RUNTIME_PROCESSES = DEFAULT_PROCESSES
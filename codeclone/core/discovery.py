@@ -106,10 +106,6 @@ DiscoveryBuffers = tuple[
 ]
 
 
-def _group_items_from_cache(rows: Sequence[Mapping[str, object]]) -> list[GroupItem]:
-    return [dict(row) for row in rows]
-
-
 def _new_discovery_buffers() -> DiscoveryBuffers:
     # Keep buffer order aligned with DiscoveryBuffers above.
     return [], [], [], [], [], [], set(), set(), [], [], [], [], [], [], []
@@ -144,6 +140,11 @@ def discover(*, boot: BootstrapResult, cache: Cache) -> DiscoveryResult:
     cached_relationship_facts: list[FunctionRelationshipFacts] = []
     cached_source_stats_by_file: list[tuple[str, int, int, int, int]] = []
     cached_lines = cached_functions = cached_methods = cached_classes = 0
+    skip_metrics = bool(boot.args.skip_metrics)
+    get_cached_entry = cache.get_file_entry
+    extend_units = cached_units.extend
+    extend_blocks = cached_blocks.extend
+    extend_segments = cached_segments.extend
     all_file_paths: list[str] = []
 
     for filepath in iter_py_files(str(boot.root)):
@@ -155,11 +156,11 @@ def discover(*, boot: BootstrapResult, cache: Cache) -> DiscoveryResult:
             files_skipped += 1
             skipped_warnings.append(f"{filepath}: {exc}")
             continue
-        cached = cache.get_file_entry(filepath)
+        cached = get_cached_entry(filepath)
         if cached and cached.get("stat") == stat:
             cached_source_stats = _usable_cached_source_stats(
                 cached,
-                skip_metrics=boot.args.skip_metrics,
+                skip_metrics=skip_metrics,
                 collect_structural_findings=collect_structural_findings,
             )
             if cached_source_stats is None:
@@ -174,10 +175,12 @@ def discover(*, boot: BootstrapResult, cache: Cache) -> DiscoveryResult:
             cached_source_stats_by_file.append(
                 (filepath, lines, functions, methods, classes)
             )
-            cached_units.extend(_group_items_from_cache(cached["units"]))
-            cached_blocks.extend(_group_items_from_cache(cached["blocks"]))
-            cached_segments.extend(_group_items_from_cache(cached["segments"]))
-            if not boot.args.skip_metrics:
+            # Shallow copies keep canonical cache rows immutable downstream;
+            # map(dict, ...) feeds list.extend without an intermediate list.
+            extend_units(map(dict, cached["units"]))
+            extend_blocks(map(dict, cached["blocks"]))
+            extend_segments(map(dict, cached["segments"]))
+            if not skip_metrics:
                 (
                     class_metrics,
                     module_deps,
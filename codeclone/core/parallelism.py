@@ -7,9 +7,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from ..analysis.phase_ledger import PhaseLedger, PhaseSnapshot
+from ..analysis.phase_ledger import PhaseSnapshot
 from ..cache.entries import SourceStatsDict
 from ..cache.store import Cache
 from ..models import (
@@ -26,8 +27,8 @@ from ..models import (
     StructuralFindingGroup,
 )
 from ._types import (
-    DEFAULT_BATCH_SIZE,
     DEFAULT_RUNTIME_PROCESSES,
+    PARALLEL_CHUNKS_PER_WORKER,
     PARALLEL_MIN_FILES_FLOOR,
     PARALLEL_MIN_FILES_PER_WORKER,
     BootstrapResult,
@@ -43,7 +44,7 @@ from ._types import (
     _should_collect_structural_findings,
     _unit_to_group_item,
 )
-from .worker import _invoke_process_file
+from .worker import _process_file_task
 
 
 def _parallel_min_files(processes: int) -> int:
@@ -62,6 +63,10 @@ def _should_use_parallel(files_count: int, processes: int) -> bool:
     return files_count >= _parallel_min_files(processes)
 
 
+def _parallel_chunksize(files_count: int, processes: int) -> int:
+    return max(1, files_count // (processes * PARALLEL_CHUNKS_PER_WORKER))
+
+
 def process(
     *,
     boot: BootstrapResult,
@@ -70,7 +75,6 @@ def process(
     on_advance: Callable[[], None] | None = None,
     on_worker_error: Callable[[str], None] | None = None,
     on_parallel_fallback: Callable[[Exception], None] | None = None,
-    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> ProcessingResult:
     files_to_process = discovery.files_to_process
     if not files_to_process:
@@ -166,9 +170,21 @@ def process(
 
     collect_phases = is_observability_enabled()
     batch_snapshot = PhaseSnapshot.empty()
-
-    def _phase_ledger_for_file() -> PhaseLedger | None:
-        return PhaseLedger(active=True) if collect_phases else None
+    process_file_task = partial(
+        _process_file_task,
+        root=root_str,
+        cfg=boot.config,
+        min_loc=min_loc,
+        min_stmt=min_stmt,
+        collect_structural_findings=collect_structural_findings,
+        collect_api_surface=collect_api_surface,
+        api_include_private_modules=api_include_private_modules,
+        block_min_loc=block_min_loc,
+        block_min_stmt=block_min_stmt,
+        segment_min_loc=segment_min_loc,
+        segment_min_stmt=segment_min_stmt,
+        collect_phases=collect_phases,
+    )
 
     def _accept_result(result: FileProcessResult) -> None:
         nonlocal batch_snapshot
@@ -225,16 +241,14 @@ def process(
                 result.methods,
                 result.classes,
             )
+            # Flat per-field converters over slots dataclasses; ``map`` keeps
+            # the hot merge free of generator frames.
             if result.units:
-                all_units.extend(_unit_to_group_item(unit) for unit in result.units)
+                all_units.extend(map(_unit_to_group_item, result.units))
             if result.blocks:
-                all_blocks.extend(
-                    _block_to_group_item(block) for block in result.blocks
-                )
+                all_blocks.extend(map(_block_to_group_item, result.blocks))
             if result.segments:
-                all_segments.extend(
-                    _segment_to_group_item(segment) for segment in result.segments
-                )
+                all_segments.extend(map(_segment_to_group_item, result.segments))
             if result.structural_findings:
                 all_structural_findings.extend(result.structural_findings)
             if not boot.args.skip_metrics and result.file_metrics is not None:
@@ -266,67 +280,50 @@ def process(
         if result.error_kind == "source_read_error":
             source_read_failures.append(failure)
 
+    def _record_worker_failure(filepath: str, exc: Exception) -> None:
+        nonlocal files_skipped
+        files_skipped += 1
+        failed_files.append(f"{filepath}: {exc}")
+        if on_worker_error is not None:
+            on_worker_error(str(exc))
+
     def _run_sequential(files: Sequence[str]) -> None:
         for filepath in files:
-            _accept_result(
-                _invoke_process_file(
-                    filepath,
-                    root_str,
-                    boot.config,
-                    min_loc,
-                    min_stmt,
-                    collect_structural_findings=collect_structural_findings,
-                    collect_api_surface=collect_api_surface,
-                    api_include_private_modules=api_include_private_modules,
-                    block_min_loc=block_min_loc,
-                    block_min_stmt=block_min_stmt,
-                    segment_min_loc=segment_min_loc,
-                    segment_min_stmt=segment_min_stmt,
-                    phase_ledger=_phase_ledger_for_file(),
-                )
-            )
+            _accept_result(process_file_task(filepath))
+            if on_advance is not None:
+                on_advance()
+
+    def _run_parallel(executor: ProcessPoolExecutor) -> None:
+        # ``map`` ships ``chunksize`` paths per IPC round trip and pickles the
+        # bound task arguments once per chunk instead of once per file.
+        results = executor.map(
+            process_file_task,
+            files_to_process,
+            chunksize=_parallel_chunksize(len(files_to_process), processes),
+        )
+        pool_error: Exception | None = None
+        for filepath in files_to_process:
+            if pool_error is None:
+                try:
+                    result = next(results)
+                except Exception as exc:  # pragma: no cover - worker crash
+                    # A failure raised by the map iterator ends it; every
+                    # remaining file is reported with the same pool error.
+                    pool_error = exc
+            if pool_error is not None:
+                _record_worker_failure(filepath, pool_error)
+            else:
+                try:
+                    _accept_result(result)
+                except Exception as exc:  # pragma: no cover - malformed result
+                    _record_worker_failure(filepath, exc)
             if on_advance is not None:
                 on_advance()
 
     if _should_use_parallel(len(files_to_process), processes):
         try:
             with ProcessPoolExecutor(max_workers=processes) as executor:
-                for idx in range(0, len(files_to_process), batch_size):
-                    batch = files_to_process[idx : idx + batch_size]
-                    futures = [
-                        executor.submit(
-                            _invoke_process_file,
-                            filepath,
-                            root_str,
-                            boot.config,
-                            min_loc,
-                            min_stmt,
-                            collect_structural_findings=collect_structural_findings,
-                            collect_api_surface=collect_api_surface,
-                            api_include_private_modules=api_include_private_modules,
-                            block_min_loc=block_min_loc,
-                            block_min_stmt=block_min_stmt,
-                            segment_min_loc=segment_min_loc,
-                            segment_min_stmt=segment_min_stmt,
-                            phase_ledger=_phase_ledger_for_file(),
-                        )
-                        for filepath in batch
-                    ]
-                    future_to_path = {
-                        id(future): filepath
-                        for future, filepath in zip(futures, batch, strict=True)
-                    }
-                    for future in as_completed(futures):
-                        filepath = future_to_path[id(future)]
-                        try:
-                            _accept_result(future.result())
-                        except Exception as exc:  # pragma: no cover - worker crash
-                            files_skipped += 1
-                            failed_files.append(f"{filepath}: {exc}")
-                            if on_worker_error is not None:
-                                on_worker_error(str(exc))
-                        if on_advance is not None:
-                            on_advance()
+                _run_parallel(executor)
         except (OSError, RuntimeError, PermissionError) as exc:
             if on_parallel_fallback is not None:
                 on_parallel_fallback(exc)
@@ -337,10 +334,16 @@ def process(
     volumes = batch_snapshot.volume_map()
     phase_snapshot = batch_snapshot if volumes.get("files_timed", 0) > 0 else None
 
+    # Sort the large group-item lists in place so freezing them does not hold
+    # a second full-size sorted copy alongside the accumulators.
+    all_units.sort(key=_group_item_sort_key)
+    all_blocks.sort(key=_group_item_sort_key)
+    all_segments.sort(key=_group_item_sort_key)
+
     return ProcessingResult(
-        units=tuple(sorted(all_units, key=_group_item_sort_key)),
-        blocks=tuple(sorted(all_blocks, key=_group_item_sort_key)),
-        segments=tuple(sorted(all_segments, key=_group_item_sort_key)),
+        units=tuple(all_units),
+        blocks=tuple(all_blocks),
+        segments=tuple(all_segments),
         class_metrics=tuple(sorted(all_class_metrics, key=_class_metric_sort_key)),
         module_deps=tuple(sorted(all_module_deps, key=_module_dep_sort_key)),
         dead_candidates=tuple(
@@ -17,7 +17,6 @@ from ..report.gates.evaluator import (
     gate_state_from_project_metrics as _gate_state_from_metrics,
 )
 from ..report.renderers.json import render_json_report_document
-from ..report.renderers.text import render_text_report_document
 from ._types import (
     AnalysisResult,
     BootstrapResult,
@@ -47,6 +46,12 @@ def _load_sarif_report_renderer() -> Callable[..., str]:
     return to_sarif_report
 
 
+def _load_text_report_renderer() -> Callable[[Mapping[str, object]], str]:
+    from ..report.renderers.text import render_text_report_document
+
+    return render_text_report_document
+
+
 def _load_report_document_builder() -> Callable[..., dict[str, object]]:
     from ..report.document.builder import build_report_document
 
@@ -207,7 +212,7 @@ def report(
             contents[key] = _render_projection_artifact(loader())
 
     if boot.output_paths.text and report_document is not None:
-        contents["text"] = render_text_report_document(report_document)
+        contents["text"] = _load_text_report_renderer()(report_document)
 
     return ReportArtifacts(
         html=contents["html"],
@@ -10,6 +10,7 @@ import inspect
 import os
 from collections.abc import Callable
 from functools import lru_cache
+from typing import BinaryIO
 
 from ..analysis.normalizer import NormalizationConfig
 from ..analysis.phase_ledger import (
@@ -19,6 +20,7 @@ from ..analysis.phase_ledger import (
 )
 from ..analysis.units import extract_units_and_stats_from_source
 from ..cache.entries import FileStat
+from ..cache.store import file_stat_from_result
 from ..contracts import (
     DEFAULT_BLOCK_MIN_LOC,
     DEFAULT_BLOCK_MIN_STMT,
@@ -29,6 +31,38 @@ from ..scanner import module_name_from_path, resolved_path_under_root
 from ._types import MAX_FILE_SIZE, FileProcessResult
 
 
+def _read_source_text(handle: BinaryIO) -> str:
+    """Read an open source file as UTF-8 with one binary read and one decode.
+
+    Newlines are translated the same way text-mode reads do, so offsets and
+    line counts stay identical to ``Path.read_text``.
+    """
+    source = handle.read().decode("utf-8")
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
+
+
+def _failed_result(filepath: str, error: str, error_kind: str) -> FileProcessResult:
+    # Failures only carry identity and diagnostics; every payload field keeps
+    # its dataclass default.
+    return FileProcessResult(
+        filepath=filepath, success=False, error=error, error_kind=error_kind
+    )
+
+
+def _open_failed_result(
+    filepath: str, path: str | os.PathLike[str], error: OSError
+) -> FileProcessResult:
+    # Keep the stat-vs-read error split: a missing file is a stat error, while
+    # a file that exists but cannot be opened is a source read failure.
+    try:
+        os.stat(path)
+    except OSError as exc:
+        return _failed_result(filepath, f"Cannot stat file: {exc}", "stat_error")
+    return _failed_result(filepath, f"Cannot read file: {error}", "source_read_error")
+
+
 def process_file(
     filepath: str,
     root: str,
@@ -47,52 +81,37 @@ def process_file(
     try:
         resolved = resolved_path_under_root(filepath, root)
         if resolved is None:
-            return FileProcessResult(
-                filepath=filepath,
-                success=False,
-                error="Source path resolves outside repository root.",
-                error_kind="source_read_error",
+            return _failed_result(
+                filepath,
+                "Source path resolves outside repository root.",
+                "source_read_error",
             )
+        # One open serves both the stat signature and the read, so the path is
+        # resolved by the kernel once per file.
+        stat_result: os.stat_result | None = None
         try:
-            stat_result = os.stat(resolved)
-            if stat_result.st_size > MAX_FILE_SIZE:
-                return FileProcessResult(
-                    filepath=filepath,
-                    success=False,
-                    error=(
+            with open(resolved, "rb") as handle:
+                stat_result = os.fstat(handle.fileno())
+                if stat_result.st_size > MAX_FILE_SIZE:
+                    return _failed_result(
+                        filepath,
                         f"File too large: {stat_result.st_size} bytes "
-                        f"(max {MAX_FILE_SIZE})"
-                    ),
-                    error_kind="file_too_large",
-                )
-        except OSError as exc:
-            return FileProcessResult(
-                filepath=filepath,
-                success=False,
-                error=f"Cannot stat file: {exc}",
-                error_kind="stat_error",
-            )
-        stat: FileStat = {
-            "mtime_ns": stat_result.st_mtime_ns,
-            "size": stat_result.st_size,
-        }
-        try:
-            source = resolved.read_text("utf-8")
+                        f"(max {MAX_FILE_SIZE})",
+                        "file_too_large",
+                    )
+                source = _read_source_text(handle)
         except UnicodeDecodeError as exc:
-            return FileProcessResult(
-                filepath=filepath,
-                success=False,
-                error=f"Encoding error: {exc}",
-                error_kind="source_read_error",
+            return _failed_result(
+                filepath, f"Encoding error: {exc}", "source_read_error"
             )
         except OSError as exc:
-            return FileProcessResult(
-                filepath=filepath,
-                success=False,
-                error=f"Cannot read file: {exc}",
-                error_kind="source_read_error",
+            if stat_result is None:
+                return _open_failed_result(filepath, resolved, exc)
+            return _failed_result(
+                filepath, f"Cannot read file: {exc}", "source_read_error"
             )
-        module_name = module_name_from_path(root, filepath)
+        stat: FileStat = file_stat_from_result(stat_result)
+        module_name = module_name_from_path(root, filepath, resolved_filepath=resolved)
         units, blocks, segments, source_stats, file_metrics, structural_findings = (
             extract_units_and_stats_from_source(
                 source=source,
@@ -131,11 +150,10 @@ def process_file(
             phase_snapshot=phase_snapshot,
         )
     except Exception as exc:  # pragma: no cover - defensive shell around workers
-        return FileProcessResult(
-            filepath=filepath,
-            success=False,
-            error=f"Unexpected error: {type(exc).__name__}: {exc}",
-            error_kind="unexpected_error",
+        return _failed_result(
+            filepath,
+            f"Unexpected error: {type(exc).__name__}: {exc}",
+            "unexpected_error",
         )
 
 
@@ -186,6 +204,42 @@ def _invoke_process_file(
     )
 
 
+def _process_file_task(
+    filepath: str,
+    *,
+    root: str,
+    cfg: NormalizationConfig,
+    min_loc: int,
+    min_stmt: int,
+    collect_structural_findings: bool,
+    collect_api_surface: bool,
+    api_include_private_modules: bool,
+    block_min_loc: int,
+    block_min_stmt: int,
+    segment_min_loc: int,
+    segment_min_stmt: int,
+    collect_phases: bool = False,
+) -> FileProcessResult:
+    # Module-level so ``functools.partial`` over it pickles once per map chunk.
+    # The phase ledger is created per file inside the worker: a bound ledger
+    # would be shared by every file in the chunk and double-count snapshots.
+    return _invoke_process_file(
+        filepath,
+        root,
+        cfg,
+        min_loc,
+        min_stmt,
+        collect_structural_findings=collect_structural_findings,
+        collect_api_surface=collect_api_surface,
+        api_include_private_modules=api_include_private_modules,
+        block_min_loc=block_min_loc,
+        block_min_stmt=block_min_stmt,
+        segment_min_loc=segment_min_loc,
+        segment_min_stmt=segment_min_stmt,
+        phase_ledger=PhaseLedger(active=True) if collect_phases else None,
+    )
+
+
 @lru_cache(maxsize=32)
 def _supported_process_file_kwarg_names(
     process_callable: Callable[..., FileProcessResult],
@@ -9,52 +9,68 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ...models import GroupItemsLike, GroupMap
+    from ...models import GroupItemLike, GroupItemsLike, GroupMap
 
+# Bucketing keeps references to the input items; only members of groups that
+# survive filtering are copied, so singleton buckets (the common case) never
+# allocate a dict.
+_Buckets = dict[str, list["GroupItemLike"]]
 
-def _group_items_by_key(
+
+def _bucket_items_by_key(
     items: GroupItemsLike,
     *,
     key_name: str,
-) -> GroupMap:
-    grouped: GroupMap = {}
+) -> _Buckets:
+    buckets: _Buckets = {}
     for item in items:
-        grouped.setdefault(str(item[key_name]), []).append(dict(item))
-    return grouped
+        key = str(item[key_name])
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [item]
+        else:
+            bucket.append(item)
+    return buckets
 
 
-def _filter_groups_by_size(
-    groups: GroupMap,
+def _filter_buckets_by_size(
+    buckets: _Buckets,
     *,
     min_occurrences: int,
-) -> GroupMap:
+) -> _Buckets:
     return {
         group_key: grouped_items
-        for group_key, grouped_items in groups.items()
+        for group_key, grouped_items in buckets.items()
         if len(grouped_items) >= min_occurrences
     }
 
 
 def build_groups(units: GroupItemsLike) -> GroupMap:
-    groups: GroupMap = {}
+    buckets: _Buckets = {}
     for unit in units:
-        fingerprint = str(unit["fingerprint"])
-        loc_bucket = str(unit["loc_bucket"])
-        key = f"{fingerprint}|{loc_bucket}"
-        groups.setdefault(key, []).append(dict(unit))
-    return {group_key: items for group_key, items in groups.items() if len(items) > 1}
+        key = f"{unit['fingerprint']}|{unit['loc_bucket']}"
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [unit]
+        else:
+            bucket.append(unit)
+    return {
+        group_key: [dict(item) for item in items]
+        for group_key, items in buckets.items()
+        if len(items) > 1
+    }
 
 
 def build_block_groups(blocks: GroupItemsLike, min_functions: int = 2) -> GroupMap:
-    groups: GroupMap = {}
-    for block in blocks:
-        groups.setdefault(str(block["block_hash"]), []).append(dict(block))
-
     filtered: GroupMap = {}
-    for block_hash, items in groups.items():
+    for block_hash, items in _bucket_items_by_key(
+        blocks, key_name="block_hash"
+    ).items():
+        if len(items) < min_functions:
+            continue
         functions = {str(item["qualname"]) for item in items}
         if len(functions) >= min_functions:
-            filtered[block_hash] = items
+            filtered[block_hash] = [dict(item) for item in items]
 
     return filtered
 
@@ -62,25 +78,24 @@ def build_block_groups(blocks: GroupItemsLike, min_functions: int = 2) -> GroupM
 def build_segment_groups(
     segments: GroupItemsLike, min_occurrences: int = 2
 ) -> GroupMap:
-    signature_groups = _filter_groups_by_size(
-        _group_items_by_key(segments, key_name="segment_sig"),
+    signature_groups = _filter_buckets_by_size(
+        _bucket_items_by_key(segments, key_name="segment_sig"),
         min_occurrences=min_occurrences,
     )
 
     confirmed: GroupMap = {}
     for items in signature_groups.values():
-        hash_groups = _filter_groups_by_size(
-            _group_items_by_key(items, key_name="segment_hash"),
+        hash_groups = _filter_buckets_by_size(
+            _bucket_items_by_key(items, key_name="segment_hash"),
             min_occurrences=min_occurrences,
         )
 
         for segment_hash, hash_items in hash_groups.items():
-            by_function: GroupMap = {}
-            for item in hash_items:
-                by_function.setdefault(str(item["qualname"]), []).append(item)
-
+            by_function = _bucket_items_by_key(hash_items, key_name="qualname")
             for qualname, q_items in by_function.items():
                 if len(q_items) >= min_occurrences:
-                    confirmed[f"{segment_hash}|{qualname}"] = q_items
+                    confirmed[f"{segment_hash}|{qualname}"] = [
+                        dict(item) for item in q_items
+                    ]
 
     return confirmed
@@ -208,6 +208,8 @@ def print_gating_failure_block(
     normalized_entries = [("policy", policy_context(args=args, gate_kind=code))]
     normalized_entries.extend((key, str(value)) for key, value in entries)
     width = max(len(key) for key, _ in normalized_entries)
-    console.print()
-    for key, value in normalized_entries:
-        console.print(f"  {key:<{width}}: {value}")
+    # Render the blank separator and all entries in one print call.
+    console.print(
+        "\n"
+        + "\n".join(f"  {key:<{width}}: {value}" for key, value in normalized_entries)
+    )
@@ -80,6 +80,7 @@ class _FileCache:
 
 _PYGMENTS_IMPORTER_ID: int | None = None
 _PYGMENTS_API: tuple[ModuleType, ModuleType, ModuleType] | None = None
+_PYGMENTS_HIGHLIGHTER: tuple[object, object, object] | None = None
 
 
 def _load_pygments_api() -> tuple[ModuleType, ModuleType, ModuleType] | None:
@@ -116,10 +117,17 @@ def _try_pygments(code: str) -> str | None:
         return None
     pygments, formatters, lexers = pygments_api
 
-    highlight = pygments.highlight
-    formatter_cls = formatters.HtmlFormatter
-    lexer_cls = lexers.PythonLexer
-    result = highlight(code, lexer_cls(), formatter_cls(nowrap=True))
+    global _PYGMENTS_HIGHLIGHTER
+    # Lexer and formatter are stateless between calls; build them once per
+    # loaded API instead of once per snippet.
+    if _PYGMENTS_HIGHLIGHTER is None or _PYGMENTS_HIGHLIGHTER[0] is not pygments_api:
+        _PYGMENTS_HIGHLIGHTER = (
+            pygments_api,
+            lexers.PythonLexer(),
+            formatters.HtmlFormatter(nowrap=True),
+        )
+    _, lexer, formatter = _PYGMENTS_HIGHLIGHTER
+    result = pygments.highlight(code, lexer, formatter)
     return result if isinstance(result, str) else None
 
 
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 from ..contracts.errors import ValidationError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 DEFAULT_EXCLUDES = (
     ".git",
@@ -105,23 +105,39 @@ def _is_included_python_file(
     return _is_under_root(resolved, rootp)
 
 
-def _walk_file_candidate(
+def _iter_candidate_paths(
     *,
-    dirpath: str,
-    filename: str,
-    excludes_set: set[str],
     rootp: Path,
-) -> str | None:
-    if not filename.endswith(".py"):
-        return None
-    file_path = os.path.join(dirpath, filename)
-    if os.path.islink(file_path) and not _is_included_python_file(
-        file_path=Path(file_path),
-        excludes_set=excludes_set,
-        rootp=rootp,
-    ):
-        return None
-    return file_path
+    excludes_set: set[str],
+) -> Iterator[str]:
+    # scandir entries carry the dirent type, so symlink checks cost no extra
+    # lstat per file; symlinked directories are not descended into.
+    pending = [str(rootp)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                listed = list(entries)
+        except OSError:
+            continue
+        for entry in listed:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if name not in excludes_set and not entry.is_symlink():
+                    pending.append(entry.path)
+                continue
+            if not name.endswith(".py"):
+                continue
+            if entry.is_symlink() and not _is_included_python_file(
+                file_path=Path(entry.path),
+                excludes_set=excludes_set,
+                rootp=rootp,
+            ):
+                continue
+            yield entry.path
 
 
 def iter_py_files(
@@ -150,34 +166,25 @@ def iter_py_files(
 
     # Collect and filter first, then sort for deterministic output.
     candidates: list[str] = []
-    for dirpath, dirnames, filenames in os.walk(
-        rootp,
-        topdown=True,
-        followlinks=False,
-    ):
-        dirnames[:] = [name for name in dirnames if name not in excludes_set]
-        for filename in filenames:
-            candidate = _walk_file_candidate(
-                dirpath=dirpath,
-                filename=filename,
-                excludes_set=excludes_set,
-                rootp=rootp,
+    for candidate in _iter_candidate_paths(rootp=rootp, excludes_set=excludes_set):
+        candidates.append(candidate)
+        if len(candidates) > max_files:
+            raise ValidationError(
+                f"File count exceeds limit of {max_files}. "
+                "Use more specific root or increase limit."
             )
-            if candidate is None:
-                continue
-            candidates.append(candidate)
-            if len(candidates) > max_files:
-                raise ValidationError(
-                    f"File count exceeds limit of {max_files}. "
-                    "Use more specific root or increase limit."
-                )
 
     yield from sorted(candidates)
 
 
-def module_name_from_path(root: str, filepath: str) -> str:
+def module_name_from_path(
+    root: str,
+    filepath: str,
+    *,
+    resolved_filepath: Path | None = None,
+) -> str:
     rootp = Path(root).resolve()
-    fp = Path(filepath).resolve()
+    fp = Path(filepath).resolve() if resolved_filepath is None else resolved_filepath
     rel = fp.relative_to(rootp)
     # strip ".py"
     stem = rel.with_suffix("")
@@ -217,9 +217,18 @@ def _print_verbose_clone_hashes(
 ) -> None:
     if not clone_hashes:
         return
-    console.print(f"\n    {label}:")
-    for clone_hash in sorted(clone_hashes):
-        console.print(f"      - {clone_hash}")
+    # One print call: the console flushes per call, so thousands of new
+    # hashes would otherwise cost one write per line. Hashes are opaque ids,
+    # so skip Rich's repr highlighter scan over the whole block.
+    console.print(
+        "\n".join(
+            [
+                f"\n    {label}:",
+                *(f"      - {clone_hash}" for clone_hash in sorted(clone_hashes)),
+            ]
+        ),
+        highlight=False,
+    )
 
 
 def print_banner(*, root: Path | None = None) -> None:
@@ -11,16 +11,7 @@ import time
 from collections.abc import Callable
 from dataclasses import replace
 from pathlib import Path
-from typing import TypeVar
-
-from rich.console import Console as RichConsole
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
+from typing import TYPE_CHECKING, TypeVar
 
 from ... import ui_messages as ui
 from ...cache.store import Cache
@@ -37,6 +28,16 @@ from .attrs import bool_attr
 from .console import PlainConsole
 from .types import require_status_console
 
+if TYPE_CHECKING:
+    from rich.console import Console as RichConsole
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
 
 def _save_cache_after_analysis(
     *,
@@ -122,6 +123,9 @@ def run_analysis_stages(
     def _require_rich_console(value: object) -> RichConsole:
         if isinstance(value, PlainConsole):
             raise RuntimeError("Rich console is required when progress UI is enabled.")
+        # Deferred: quiet / no-progress runs never reach the progress UI.
+        from rich.console import Console as RichConsole
+
         if not isinstance(value, RichConsole):
             raise RuntimeError("Rich console is required when progress UI is enabled.")
         return value
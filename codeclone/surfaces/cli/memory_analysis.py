@@ -22,7 +22,6 @@ from ...core.parallelism import process
 from ...core.pipeline import analyze
 from ...core.reporting import report
 from ...memory.report_trust import assess_cached_report_trust
-from ...report.html import build_html_report
 from ...utils.json_io import read_json_object
 from . import baseline_state as cli_baseline_state
 from . import execution as cli_execution
@@ -211,7 +210,11 @@ def run_memory_analysis_report(*, root_path: Path) -> dict[str, object]:
         report_meta=report_meta,
         new_func=diff_context.new_func,
         new_block=diff_context.new_block,
-        html_builder=build_html_report,
+        html_builder=(
+            cli_reports_output._load_html_report_builder()
+            if boot.output_paths.html
+            else None
+        ),
         metrics_diff=diff_context.metrics_diff,
         coverage_adoption_diff_available=diff_context.coverage_adoption_diff_available,
         api_surface_diff_available=diff_context.api_surface_diff_available,
@@ -14,6 +14,10 @@ from typing import Protocol
 
 from ... import ui_messages as ui
 from ...contracts import ExitCode
+from ...utils.json_io import (
+    DEFAULT_WRITE_CHUNK_CHARS,
+    write_text_atomically_chunked,
+)
 from . import state as cli_state
 from .attrs import bool_attr, optional_text_attr
 from .types import (
@@ -25,6 +29,8 @@ from .types import (
     require_status_console,
 )
 
+_REPORT_WRITE_CHUNK_CHARS = DEFAULT_WRITE_CHUNK_CHARS
+
 
 class _QuietArgs(Protocol):
     quiet: bool
@@ -46,10 +52,21 @@ def _write_report_output(
     content: str,
     label: str,
     console: PrinterLike,
+    ensured_dirs: set[Path] | None = None,
 ) -> None:
     try:
-        out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(content, "utf-8")
+        # Reports usually share one directory; create it once per write batch.
+        if ensured_dirs is None or out.parent not in ensured_dirs:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            if ensured_dirs is not None:
+                ensured_dirs.add(out.parent)
+        # Write next to the target and rename, so an interrupted run never
+        # leaves a truncated report behind.
+        write_text_atomically_chunked(
+            out,
+            content,
+            chunk_chars=_REPORT_WRITE_CHUNK_CHARS,
+        )
     except OSError as exc:
         console.print(
             ui.fmt_contract_error(
@@ -59,6 +76,14 @@ def _write_report_output(
         sys.exit(ExitCode.CONTRACT_ERROR)
 
 
+def _load_html_report_builder() -> Callable[..., str]:
+    # The HTML renderer is the heaviest import in the report stack; load it
+    # only for runs that actually write an HTML report.
+    from ...report.html import build_html_report
+
+    return build_html_report
+
+
 def _open_html_report_in_browser(*, path: Path) -> None:
     if not webbrowser.open_new_tab(path.as_uri()):
         raise OSError("no browser handler available")
@@ -74,6 +99,7 @@ def write_report_outputs(
 ) -> str | None:
     html_report_path: str | None = None
     saved_reports: list[tuple[str, Path]] = []
+    ensured_dirs: set[Path] = set()
     html_path = _path_attr(output_paths, "html")
     json_path = _path_attr(output_paths, "json")
     md_path = _path_attr(output_paths, "md")
@@ -92,6 +118,7 @@ def write_report_outputs(
             content=html_report,
             label="HTML",
             console=console,
+            ensured_dirs=ensured_dirs,
         )
         html_report_path = str(out)
         saved_reports.append(("HTML", out))
@@ -103,6 +130,7 @@ def write_report_outputs(
             content=json_report,
             label="JSON",
             console=console,
+            ensured_dirs=ensured_dirs,
         )
         saved_reports.append(("JSON", out))
 
@@ -113,6 +141,7 @@ def write_report_outputs(
             content=md_report,
             label="Markdown",
             console=console,
+            ensured_dirs=ensured_dirs,
         )
         saved_reports.append(("Markdown", out))
 
@@ -123,6 +152,7 @@ def write_report_outputs(
             content=sarif_report,
             label="SARIF",
             console=console,
+            ensured_dirs=ensured_dirs,
         )
         saved_reports.append(("SARIF", out))
 
@@ -133,18 +163,20 @@ def write_report_outputs(
             content=text_report,
             label="text",
             console=console,
+            ensured_dirs=ensured_dirs,
         )
         saved_reports.append(("Text", out))
 
     if saved_reports and not args.quiet:
         cwd = Path.cwd()
-        console.print()
+        notices: list[str] = [""]
         for label, path in saved_reports:
             try:
                 display = path.relative_to(cwd)
             except ValueError:
                 display = path
-            console.print(f"  [bold]{label} report saved:[/bold] [dim]{display}[/dim]")
+            notices.append(f"  [bold]{label} report saved:[/bold] [dim]{display}[/dim]")
+        console.print("\n".join(notices))
 
     if open_html_report and html_path is not None:
         try:
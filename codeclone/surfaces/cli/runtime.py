@@ -202,11 +202,11 @@ def gating_mode_enabled(args: object) -> bool:
 def print_failed_files(*, failed_files: tuple[str, ...], console: PrinterLike) -> None:
     if not failed_files:
         return
-    console.print(ui.fmt_failed_files_header(len(failed_files)))
-    for failure in failed_files[:10]:
-        console.print(f"  • {failure}")
+    lines = [ui.fmt_failed_files_header(len(failed_files))]
+    lines.extend(f"  • {failure}" for failure in failed_files[:10])
     if len(failed_files) > 10:
-        console.print(f"  ... and {len(failed_files) - 10} more")
+        lines.append(f"  ... and {len(failed_files) - 10} more")
+    console.print("\n".join(lines))
 
 
 def _resolve_cache_path(
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Protocol
 
@@ -34,7 +35,6 @@ from ...core.reporting import gate, report
 from ...models import MetricsDiff
 from ...observability import bootstrap as start_observability
 from ...observability import operation
-from ...report.html import build_html_report
 from . import baseline_state as cli_baseline_state
 from . import changed_scope as cli_changed_scope
 from . import console as cli_console
@@ -87,7 +87,7 @@ __all__ = [
     "analyze",
     "apply_pyproject_config_overrides",
     "bootstrap",
-    "build_html_report",
+    "build_html_report",  # noqa: F822 - resolved by __getattr__
     "collect_explicit_cli_dests",
     "console",
     "discover",
@@ -143,6 +143,7 @@ _report_path_origins = cli_reports_output._report_path_origins
 _resolve_output_paths = cli_reports_output._resolve_output_paths
 _validate_report_ui_flags = cli_reports_output._validate_report_ui_flags
 _write_report_outputs = cli_reports_output._write_report_outputs
+_load_html_report_builder = cli_reports_output._load_html_report_builder
 
 _configure_metrics_mode = cli_runtime._configure_metrics_mode
 _metrics_computed = cli_runtime._metrics_computed
@@ -168,6 +169,14 @@ build_metrics_snapshot = cli_summary.build_metrics_snapshot
 build_summary_counts = cli_summary.build_summary_counts
 
 
+def __getattr__(name: str) -> Callable[..., str]:
+    # ``build_html_report`` stays a public re-export of the real renderer,
+    # resolved on first access so plain runs never import the HTML stack.
+    if name == "build_html_report":
+        return _load_html_report_builder()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _set_console(value: object) -> object:
     cli_state.set_console(value)
     return value
@@ -430,21 +439,12 @@ def _main_impl() -> None:
     explicit_cli_dests = collect_explicit_cli_dests(ap, argv=raw_argv)
     report_path_origins = _report_path_origins(raw_argv)
     report_generated_at_utc = cli_meta_mod._current_report_timestamp_utc()
-    strictness_explicit = any(
-        arg == "--strictness" or arg.startswith("--strictness=") for arg in raw_argv
-    )
-    cache_path_from_args = any(
-        arg in {"--cache-dir", "--cache-path"}
-        or arg.startswith(("--cache-dir=", "--cache-path="))
-        for arg in sys.argv
-    )
-    baseline_path_from_args = any(
-        arg == "--baseline" or arg.startswith("--baseline=") for arg in sys.argv
-    )
-    metrics_path_from_args = any(
-        arg == "--metrics-baseline" or arg.startswith("--metrics-baseline=")
-        for arg in sys.argv
-    )
+    # The explicit-dest scan already maps every option spelling (including
+    # --cache-dir) to its dest, so no further argv passes are needed.
+    strictness_explicit = "strictness" in explicit_cli_dests
+    cache_path_from_args = "cache_path" in explicit_cli_dests
+    baseline_path_from_args = "baseline" in explicit_cli_dests
+    metrics_path_from_args = "metrics_baseline" in explicit_cli_dests
     args = ap.parse_args()
 
     root_path = _resolve_existing_root_path(args=args, printer=_console())
@@ -653,7 +653,7 @@ def _main_impl() -> None:
         report_meta=report_meta,
         new_func=diff_context.new_func,
         new_block=diff_context.new_block,
-        html_builder=build_html_report,
+        html_builder=(_load_html_report_builder() if output_paths.html else None),
         metrics_diff=diff_context.metrics_diff,
         coverage_adoption_diff_available=diff_context.coverage_adoption_diff_available,
         api_surface_diff_available=diff_context.api_surface_diff_available,
@@ -7,12 +7,14 @@
 from __future__ import annotations
 
 import os
+import stat
 import tempfile
 from pathlib import Path
 
 import orjson
 
 DEFAULT_MAX_JSON_BYTES = 64 * 1024 * 1024
+DEFAULT_WRITE_CHUNK_CHARS = 1 << 20
 
 
 class BoundedReadError(OSError):
@@ -98,6 +100,48 @@ def write_json_text_atomically(path: Path, text: str) -> None:
         raise
 
 
+def _new_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_text_atomically_chunked(
+    path: Path,
+    text: str,
+    *,
+    chunk_chars: int = DEFAULT_WRITE_CHUNK_CHARS,
+) -> None:
+    # Encode in bounded slices so large reports never need a second,
+    # full-size bytes copy next to the rendered string. Unlike the JSON
+    # writer this follows user-chosen symlinks, like a plain write_text.
+    if chunk_chars <= 0:
+        raise ValueError("chunk_chars must be positive")
+    if path.is_symlink():
+        path = Path(os.path.realpath(path))
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _new_file_mode()
+    # mkstemp opens with O_EXCL, so a planted link at the temp name is
+    # never followed.
+    fd_num, tmp_name = tempfile.mkstemp(
+        dir=path.parent,
+        suffix=".tmp",
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd_num, "w", encoding="utf-8") as fd:
+            for start in range(0, len(text), chunk_chars):
+                fd.write(text[start : start + chunk_chars])
+        # mkstemp creates 0600 files; keep the mode a plain write would give.
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def write_json_document_atomically(
     path: Path,
     document: object,
@@ -121,6 +165,7 @@ def write_json_document_atomically(
 
 __all__ = [
     "DEFAULT_MAX_JSON_BYTES",
+    "DEFAULT_WRITE_CHUNK_CHARS",
     "BoundedReadError",
     "json_text",
     "read_bounded_bytes",
@@ -128,4 +173,5 @@ __all__ = [
     "read_json_object",
     "write_json_document_atomically",
     "write_json_text_atomically",
+    "write_text_atomically_chunked",
 ]
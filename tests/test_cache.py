@@ -81,7 +81,10 @@ from codeclone.cache.entries import (
     _unit_dict_from_model,
 )
 from codeclone.cache.integrity import as_str_dict as _as_str_dict
-from codeclone.cache.integrity import sign_cache_payload
+from codeclone.cache.integrity import (
+    sign_cache_payload,
+    write_signed_cache_document,
+)
 from codeclone.cache.projection import (
     runtime_filepath_from_wire,
     wire_filepath_from_runtime,
@@ -104,6 +107,7 @@ from codeclone.models import (
     SegmentUnit,
     Unit,
 )
+from codeclone.utils.json_io import json_text
 from codeclone.utils.repo_paths import PathOutsideRepoError, RepoPathError
 
 
@@ -197,6 +201,24 @@ def test_cache_roundtrip(tmp_path: Path) -> None:
     assert loaded.cache_schema_version == Cache._CACHE_VERSION
 
 
+def test_write_signed_cache_document_matches_sorted_json_document(
+    tmp_path: Path,
+) -> None:
+    payload: dict[str, object] = {
+        "py": "cp313",
+        "files": {"pkg/a.py": {"st": [1, 2], "u": []}},
+        "ap": {"min_loc": 10, "min_stmt": 6},
+    }
+    path = tmp_path / "nested" / "cache.json"
+    write_signed_cache_document(path, version="9.9", payload=payload)
+
+    expected = json_text(
+        {"v": "9.9", "payload": payload, "sig": sign_cache_payload(payload)},
+        sort_keys=True,
+    )
+    assert path.read_text("utf-8") == expected
+
+
 def test_cache_roundtrip_preserves_function_relationship_facts(
     tmp_path: Path,
 ) -> None:
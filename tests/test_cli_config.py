@@ -16,6 +16,7 @@ import pytest
 import codeclone.config.pyproject_loader as loader_mod
 import codeclone.config.resolver as resolver_mod
 import codeclone.config.spec as spec_mod
+from codeclone.config.argparse_builder import build_parser
 from codeclone.config.pyproject_loader import ConfigValidationError
 
 
@@ -35,6 +36,19 @@ def test_collect_explicit_cli_dests_stops_on_double_dash() -> None:
     assert explicit == {"min_loc", "quiet"}
 
 
+def test_build_parser_is_reused_per_version() -> None:
+    assert build_parser("test") is build_parser("test")
+
+
+def test_collect_explicit_cli_dests_maps_cache_dir_alias_to_cache_path() -> None:
+    explicit = resolver_mod.collect_explicit_cli_dests(
+        build_parser("test"),
+        argv=(".", "--cache-dir=.cache/x.json", "--metrics-baseline"),
+    )
+    assert {"cache_path", "metrics_baseline"} <= explicit
+    assert "baseline" not in explicit
+
+
 def test_load_pyproject_config_missing_file_returns_empty(tmp_path: Path) -> None:
     assert loader_mod.load_pyproject_config(tmp_path) == {}
 
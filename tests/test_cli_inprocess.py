@@ -7,9 +7,10 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, cast
@@ -61,14 +62,6 @@ from tests._report_access import (
 )
 
 
-@dataclass(slots=True)
-class _DummyFuture:
-    _result: object
-
-    def result(self) -> object:
-        return self._result
-
-
 class _FalseExitContext:
     def __exit__(
         self,
@@ -95,11 +88,15 @@ class _DummyExecutor(_FalseExitContext):
     def _on_exit(self) -> None:
         self._active = False
 
-    def submit(
-        self, fn: Callable[..., object], *args: object, **kwargs: object
-    ) -> _DummyFuture:
-        _ = (self.max_workers, self._active)
-        return _DummyFuture(fn(*args, **kwargs))
+    def map(
+        self,
+        fn: Callable[[str], object],
+        iterable: Iterable[str],
+        *,
+        chunksize: int = 1,
+    ) -> Iterator[object]:
+        _ = (self.max_workers, self._active, chunksize)
+        return (fn(item) for item in iterable)
 
 
 class _FailingExecutor(_FalseExitContext):
@@ -128,10 +125,14 @@ class _FixedExecutor(_FalseExitContext):
     def __enter__(self) -> _FixedExecutor:
         return self
 
-    def submit(
-        self, fn: Callable[..., object], *args: object, **kwargs: object
-    ) -> _FixedFuture:
-        return self._future
+    def map(
+        self,
+        fn: Callable[[str], object],
+        iterable: Iterable[str],
+        *,
+        chunksize: int = 1,
+    ) -> Iterator[object | None]:
+        return (self._future.result() for _ in iterable)
 
 
 class _DummyProgress(_FalseExitContext):
@@ -176,7 +177,6 @@ def _patch_dummy_progress(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def _patch_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(core_parallelism, "ProcessPoolExecutor", _DummyExecutor)
-    monkeypatch.setattr(core_parallelism, "as_completed", lambda futures: futures)
 
 
 def _run_main(monkeypatch: pytest.MonkeyPatch, args: Iterable[str]) -> None:
@@ -279,7 +279,6 @@ def _patch_fixed_executor(
         "ProcessPoolExecutor",
         lambda *args, **kwargs: _FixedExecutor(future),
     )
-    monkeypatch.setattr(core_parallelism, "as_completed", lambda futures: futures)
 
 
 def _baseline_payload(
@@ -1206,7 +1205,7 @@ def test_cli_unexpected_html_render_failure_is_internal(
         raise RuntimeError("render failed")
 
     _patch_parallel(monkeypatch)
-    monkeypatch.setattr(cli, "build_html_report", _boom)
+    monkeypatch.setattr(cli, "_load_html_report_builder", lambda: _boom)
     with pytest.raises(SystemExit) as exc:
         _run_main(
             monkeypatch,
@@ -2277,22 +2276,14 @@ def test_cli_report_write_error_is_contract_error(
 ) -> None:
     _write_default_source(tmp_path)
     html_out = tmp_path / "report.html"
-    original_write_text = Path.write_text
-
-    def _raise_write_text(
-        self: Path,
-        data: str,
-        encoding: str | None = None,
-        errors: str | None = None,
-        newline: str | None = None,
-    ) -> int:
-        if self == html_out:
+    original_replace = os.replace
+
+    def _raise_replace(src: str | Path, dst: str | Path) -> None:
+        if Path(dst) == html_out:
             raise OSError("disk full")
-        return original_write_text(
-            self, data, encoding=encoding, errors=errors, newline=newline
-        )
+        original_replace(src, dst)
 
-    monkeypatch.setattr(Path, "write_text", _raise_write_text)
+    monkeypatch.setattr(os, "replace", _raise_replace)
     _assert_parallel_cli_exit(
         monkeypatch,
         [str(tmp_path), "--html", str(html_out), "--no-progress"],
@@ -48,15 +48,18 @@ from codeclone.core._types import (
 from codeclone.core.reporting import GatingResult
 from codeclone.core.worker import process_file
 from codeclone.models import HealthScore, ProjectMetrics
+from codeclone.report.gates.reasons import print_gating_failure_block
 from tests._assertions import assert_contains_all
 
 
 class _RecordingPrinter:
     def __init__(self) -> None:
         self.lines: list[str] = []
+        self.kwargs: list[dict[str, object]] = []
 
     def print(self, *objects: object, **kwargs: object) -> None:
         self.lines.append(" ".join(str(obj) for obj in objects))
+        self.kwargs.append(kwargs)
 
 
 class _TTYStream(StringIO):
@@ -95,24 +98,31 @@ def _assert_metrics_gate_schema_contract_error(
     assert any(expected_fragment in line for line in printer.lines)
 
 
-def test_process_file_stat_error(
+def test_process_file_stat_error(tmp_path: Path) -> None:
+    src = tmp_path / "a.py"
+
+    result = process_file(str(src), str(tmp_path), NormalizationConfig(), 1, 1)
+    assert result.success is False
+    assert result.error_kind == "stat_error"
+    assert result.error is not None
+    assert "Cannot stat file" in result.error
+
+
+def test_process_file_open_error_is_source_read_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     src = tmp_path / "a.py"
     src.write_text("def f():\n    return 1\n", "utf-8")
 
-    _original_stat = os.stat
-
-    def _boom(path: str, *args: object, **kwargs: object) -> os.stat_result:
-        if str(path) == str(src):
-            raise OSError("nope")
-        return _original_stat(path, *args, **kwargs)  # type: ignore[arg-type]
+    def _boom(*_args: object, **_kwargs: object) -> object:
+        raise PermissionError(13, "Permission denied")
 
-    monkeypatch.setattr(os, "stat", _boom)
+    monkeypatch.setattr(core_worker, "open", _boom, raising=False)
     result = process_file(str(src), str(tmp_path), NormalizationConfig(), 1, 1)
     assert result.success is False
+    assert result.error_kind == "source_read_error"
     assert result.error is not None
-    assert "Cannot stat file" in result.error
+    assert "Cannot read file" in result.error
 
 
 def test_process_file_encoding_error(
@@ -124,7 +134,7 @@ def test_process_file_encoding_error(
     def _boom(*_args: object, **_kwargs: object) -> str:
         raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "bad")
 
-    monkeypatch.setattr(Path, "read_text", _boom)
+    monkeypatch.setattr(core_worker, "_read_source_text", _boom)
     result = process_file(str(src), str(tmp_path), NormalizationConfig(), 1, 1)
     assert result.success is False
     assert result.error is not None
@@ -140,13 +150,25 @@ def test_process_file_read_oserror(
     def _boom(*_args: object, **_kwargs: object) -> str:
         raise OSError("read denied")
 
-    monkeypatch.setattr(Path, "read_text", _boom)
+    monkeypatch.setattr(core_worker, "_read_source_text", _boom)
     result = process_file(str(src), str(tmp_path), NormalizationConfig(), 1, 1)
     assert result.success is False
     assert result.error is not None
     assert "Cannot read file" in result.error
 
 
+def test_process_file_translates_newlines_like_text_mode(tmp_path: Path) -> None:
+    src = tmp_path / "a.py"
+    src.write_bytes(b"def f():\r\n    x = 1\r    return x\r\n")
+
+    result = process_file(str(src), str(tmp_path), NormalizationConfig(), 1, 1)
+
+    assert result.success is True
+    assert result.lines == 3
+    assert result.stat is not None
+    assert result.stat["size"] == src.stat().st_size
+
+
 def test_process_file_unexpected_error(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -748,6 +770,103 @@ def test_open_html_report_in_browser_succeeds_when_handler_exists(
     cli_reports._open_html_report_in_browser(path=report_path)
 
 
+def test_write_report_output_chunks_preserve_content(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(cli_reports, "_REPORT_WRITE_CHUNK_CHARS", 4)
+    out = tmp_path / "nested" / "report.html"
+    content = "<p>кириллица · 漢字</p>\n" * 3
+    cli_reports._write_report_output(
+        out=out,
+        content=content,
+        label="HTML",
+        console=cli._make_plain_console(),
+    )
+    assert out.read_text("utf-8") == content
+
+
+def test_write_report_output_writes_into_symlinked_directory(
+    tmp_path: Path,
+) -> None:
+    real_dir = tmp_path / "real"
+    real_dir.mkdir()
+    link_dir = tmp_path / "reports"
+    try:
+        link_dir.symlink_to(real_dir, target_is_directory=True)
+    except (NotImplementedError, OSError) as exc:
+        pytest.skip(f"symlink unavailable: {exc}")
+
+    cli_reports._write_report_output(
+        out=link_dir / "report.html",
+        content="<html></html>",
+        label="HTML",
+        console=cli._make_plain_console(),
+    )
+    assert (real_dir / "report.html").read_text("utf-8") == "<html></html>"
+
+
+def test_write_report_output_keeps_previous_report_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    out = tmp_path / "report.txt"
+    out.write_text("previous\n", encoding="utf-8")
+
+    def _raise_replace(*_args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _raise_replace)
+    with pytest.raises(SystemExit):
+        cli_reports._write_report_output(
+            out=out,
+            content="next\n",
+            label="text",
+            console=cli._make_plain_console(),
+        )
+    assert out.read_text("utf-8") == "previous\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["report.txt"]
+
+
+def test_write_report_outputs_prints_saved_notices_once(tmp_path: Path) -> None:
+    printer = _RecordingPrinter()
+    html_out = tmp_path / "report.html"
+    json_out = tmp_path / "report.json"
+    cli_reports.write_report_outputs(
+        args=Namespace(quiet=False),
+        output_paths=cast(Any, SimpleNamespace(html=html_out, json=json_out)),
+        report_artifacts=cast(Any, SimpleNamespace(html="<html></html>", json="{}")),
+        console=printer,
+    )
+    assert len(printer.lines) == 1
+    assert_contains_all(printer.lines[0], "HTML report saved:", "JSON report saved:")
+    assert html_out.read_text("utf-8") == "<html></html>"
+
+
+def test_write_report_output_creates_shared_parent_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    mkdir_calls: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def _counting_mkdir(self: Path, *args: Any, **kwargs: Any) -> None:
+        mkdir_calls.append(self)
+        original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _counting_mkdir)
+    ensured_dirs: set[Path] = set()
+    for name in ("report.json", "report.txt"):
+        cli_reports._write_report_output(
+            out=tmp_path / "out" / name,
+            content="{}",
+            label="JSON",
+            console=cli._make_plain_console(),
+            ensured_dirs=ensured_dirs,
+        )
+    assert mkdir_calls == [tmp_path / "out"]
+
+
 def test_cli_plain_console_status_context() -> None:
     plain = cli._make_plain_console()
     with plain.status("noop"):
@@ -2795,7 +2914,51 @@ def test_print_verbose_clone_hashes_prints_sorted_values() -> None:
         clone_hashes={"b-hash", "a-hash"},
     )
     assert printer.lines == [
-        "\n    Block clone hashes:",
-        "      - a-hash",
-        "      - b-hash",
+        "\n    Block clone hashes:\n      - a-hash\n      - b-hash"
     ]
+
+
+def test_print_verbose_clone_hashes_disables_highlighting() -> None:
+    printer = _RecordingPrinter()
+    cli_console._print_verbose_clone_hashes(
+        printer,
+        label="Function clone hashes",
+        clone_hashes={"a-hash"},
+    )
+    assert printer.kwargs == [{"highlight": False}]
+
+
+def test_print_failed_files_prints_block_in_one_call() -> None:
+    printer = _RecordingPrinter()
+    cli_runtime.print_failed_files(
+        failed_files=tuple(f"pkg/mod{index}.py: boom" for index in range(12)),
+        console=printer,
+    )
+    assert len(printer.lines) == 1
+    header = ui.fmt_failed_files_header(12)
+    assert printer.lines[0].startswith(header + "\n")
+    lines = printer.lines[0][len(header) + 1 :].splitlines()
+    assert lines[:10] == [f"  • pkg/mod{index}.py: boom" for index in range(10)]
+    assert lines[10:] == ["  ... and 2 more"]
+
+
+def test_print_gating_failure_block_prints_entries_in_one_call() -> None:
+    printer = _RecordingPrinter()
+    print_gating_failure_block(
+        console=printer,
+        code="threshold",
+        entries=(("clone_groups", 7), ("threshold", 5)),
+        args=Namespace(ci=False, fail_threshold=5),
+    )
+    assert len(printer.lines) == 2
+    assert printer.lines[1] == (
+        "\n  policy      : fail-threshold=5\n  clone_groups: 7\n  threshold   : 5"
+    )
+
+
+def test_workflow_build_html_report_is_the_real_renderer() -> None:
+    from codeclone.report.html import build_html_report
+
+    assert cli.build_html_report is build_html_report
+    with pytest.raises(AttributeError):
+        _ = cli.__getattr__("missing_attribute")
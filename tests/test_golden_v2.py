@@ -9,7 +9,7 @@ from __future__ import annotations
 import json
 import shutil
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import nullcontext
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -40,25 +40,18 @@ from tests._assertions import (
 _GOLDEN_V2_ROOT = Path("tests/fixtures/golden_v2").resolve()
 
 
-@dataclass(slots=True)
-class _DummyFuture:
-    value: object
-
-    def result(self) -> object:
-        return self.value
-
-
 @dataclass(slots=True)
 class _InlineExecutor:
     max_workers: int | None = None
 
-    def submit(
+    def map(
         self,
-        fn: Callable[..., object],
-        *args: object,
-        **kwargs: object,
-    ) -> _DummyFuture:
-        return _DummyFuture(fn(*args, **kwargs))
+        fn: Callable[[str], object],
+        iterable: Iterable[str],
+        *,
+        chunksize: int = 1,
+    ) -> Iterator[object]:
+        return (fn(item) for item in iterable)
 
 
 def _dummy_process_pool_executor(
@@ -73,7 +66,6 @@ def _patch_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
         "ProcessPoolExecutor",
         _dummy_process_pool_executor,
     )
-    monkeypatch.setattr(core_parallelism, "as_completed", lambda futures: futures)
 
 
 def _relative_to_root(path: str, root: Path) -> str:
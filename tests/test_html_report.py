@@ -1285,6 +1285,18 @@ def test_try_pygments_ok() -> None:
     assert result is None or isinstance(result, str)
 
 
+def test_try_pygments_reuses_lexer_and_formatter() -> None:
+    import codeclone.report.html.widgets.snippets as snippets
+
+    pytest.importorskip("pygments")
+    first = _try_pygments("x = 1")
+    highlighter = snippets._PYGMENTS_HIGHLIGHTER
+    second = _try_pygments("x = 1")
+    assert first == second
+    assert highlighter is not None
+    assert snippets._PYGMENTS_HIGHLIGHTER is highlighter
+
+
 def test_render_code_block_without_pygments_uses_escaped_fallback(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
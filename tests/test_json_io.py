@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 
 import pytest
@@ -16,6 +18,7 @@ from codeclone.utils.json_io import (
     read_json_document,
     read_json_object,
     write_json_document_atomically,
+    write_text_atomically_chunked,
 )
 
 
@@ -101,3 +104,57 @@ def test_write_json_document_atomically_rejects_symlink_parent(
         write_json_document_atomically(link_dir / "payload.json", {"ok": True})
 
     assert not (real_dir / "payload.json").exists()
+
+
+def test_write_text_atomically_chunked_preserves_content(tmp_path: Path) -> None:
+    path = tmp_path / "report.html"
+    path.write_text("previous", encoding="utf-8")
+    text = "<p>кириллица · 漢字</p>\n" * 3
+
+    write_text_atomically_chunked(path, text, chunk_chars=4)
+
+    assert path.read_text(encoding="utf-8") == text
+    assert [item.name for item in tmp_path.iterdir()] == ["report.html"]
+
+
+def test_write_text_atomically_chunked_writes_through_symlink_target(
+    tmp_path: Path,
+) -> None:
+    target = tmp_path / "target.html"
+    target.write_text("previous", encoding="utf-8")
+    link = tmp_path / "report.html"
+    try:
+        link.symlink_to(target)
+    except (NotImplementedError, OSError) as exc:
+        pytest.skip(f"symlink unavailable: {exc}")
+
+    write_text_atomically_chunked(link, "<html></html>")
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "<html></html>"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_write_text_atomically_chunked_keeps_plain_write_modes(
+    tmp_path: Path,
+) -> None:
+    umask = os.umask(0o022)
+    try:
+        fresh = tmp_path / "fresh.html"
+        write_text_atomically_chunked(fresh, "new")
+        existing = tmp_path / "existing.html"
+        existing.write_text("old", encoding="utf-8")
+        existing.chmod(0o640)
+        write_text_atomically_chunked(existing, "new")
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(fresh.stat().st_mode) == 0o644
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+
+def test_write_text_atomically_chunked_requires_positive_chunk(
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(ValueError, match="chunk_chars"):
+        write_text_atomically_chunked(tmp_path / "report.html", "x", chunk_chars=0)
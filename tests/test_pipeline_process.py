@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import builtins
 from argparse import Namespace
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Literal
 
@@ -31,6 +31,7 @@ from codeclone.core._types import (
 )
 from codeclone.core.discovery_cache import usable_cached_source_stats
 from codeclone.core.parallelism import (
+    _parallel_chunksize,
     _parallel_min_files,
     _resolve_process_count,
     process,
@@ -360,6 +361,58 @@ def test_process_parallel_executor_analyzes_real_files(tmp_path: Path) -> None:
     assert cache.get_file_entry(filepaths[0]) is not None
 
 
+def test_parallel_chunksize_spreads_files_across_workers() -> None:
+    assert _parallel_chunksize(1, 4) == 1
+    assert _parallel_chunksize(160, 4) == 10
+    assert _parallel_chunksize(161, 2) == 20
+
+
+def test_process_parallel_pool_error_marks_remaining_files_failed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    boot, discovery, cache, filepaths = _build_large_batch_case(tmp_path)
+    worker_errors: list[str] = []
+
+    class _BreakingExec:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            return None
+
+        def __enter__(self) -> _BreakingExec:
+            return self
+
+        def __exit__(self, *exc_info: object) -> Literal[False]:
+            return False
+
+        def map(
+            self,
+            fn: Callable[[str], FileProcessResult],
+            iterable: Iterable[str],
+            *,
+            chunksize: int = 1,
+        ) -> Iterator[FileProcessResult]:
+            items = iter(iterable)
+            yield fn(next(items))
+            raise RuntimeError("pool broken")
+
+    monkeypatch.setattr(core_parallelism, "ProcessPoolExecutor", _BreakingExec)
+    monkeypatch.setattr(
+        core_worker,
+        "process_file",
+        _stub_process_file(expected_root=str(tmp_path)),
+    )
+
+    result = process(
+        boot=boot,
+        discovery=discovery,
+        cache=cache,
+        on_worker_error=worker_errors.append,
+    )
+
+    assert result.files_analyzed == 1
+    assert result.files_skipped == len(filepaths) - 1
+    assert worker_errors == ["pool broken"] * (len(filepaths) - 1)
+
+
 def test_process_cache_put_file_entry_fallback_without_source_stats_support(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
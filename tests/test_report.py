@@ -163,6 +163,17 @@ def test_build_function_groups() -> None:
     assert next(iter(groups.values()))[0]["fingerprint"] == "abc"
 
 
+def test_build_groups_copies_only_grouped_items() -> None:
+    units = [
+        {"fingerprint": "abc", "loc_bucket": "20-49", "qualname": "a"},
+        {"fingerprint": "abc", "loc_bucket": "20-49", "qualname": "b"},
+    ]
+
+    items = build_groups(units)["abc|20-49"]
+    assert items == units
+    assert all(item is not unit for item, unit in zip(items, units, strict=True))
+
+
 def test_block_groups_require_multiple_functions() -> None:
     blocks = [
         {"block_hash": "h1", "qualname": "f1"},
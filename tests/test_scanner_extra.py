@@ -97,6 +97,30 @@ def test_module_name_from_path(tmp_path: Path) -> None:
     assert module_name_from_path(str(tmp_path), str(module)) == "pkg.mod"
 
 
+def test_module_name_from_path_reuses_resolved_filepath(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = tmp_path / "pkg" / "mod.py"
+    module.parent.mkdir()
+    module.write_text("x = 1\n", "utf-8")
+    resolved = module.resolve()
+    resolved_paths: list[Path] = []
+    original_resolve = Path.resolve
+
+    def _recording_resolve(self: Path, strict: bool = False) -> Path:
+        resolved_paths.append(self)
+        return original_resolve(self, strict=strict)
+
+    monkeypatch.setattr(Path, "resolve", _recording_resolve)
+
+    assert (
+        module_name_from_path(str(tmp_path), str(module), resolved_filepath=resolved)
+        == "pkg.mod"
+    )
+    assert resolved_paths == [tmp_path]
+
+
 def test_iter_py_files_invalid_root(tmp_path: Path) -> None:
     missing = tmp_path / "missing"
     with pytest.raises(ValidationError):
@@ -132,6 +156,22 @@ def test_iter_py_files_symlink_skip(tmp_path: Path) -> None:
     assert str(link) not in files
 
 
+def test_iter_py_files_keeps_in_root_symlink_and_nested_files(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "root"
+    nested = root / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    target = nested / "deep.py"
+    target.write_text("x = 1\n", "utf-8")
+    (root / "pkg" / "notes.txt").write_text("skip\n", "utf-8")
+    link = root / "alias.py"
+    _symlink_or_skip(link, target)
+
+    files = list(iter_py_files(str(root)))
+    assert files == sorted([str(link), str(target)])
+
+
 def test_iter_py_files_symlink_to_etc_skipped(tmp_path: Path) -> None:
     passwd = Path("/etc/passwd")
     if not passwd.exists():
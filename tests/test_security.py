@@ -48,8 +48,8 @@ def test_process_file_size_limit() -> None:
         cfg = NormalizationConfig()
         real_stat = os.stat(tmp_path)
 
-        # Mock os.stat to return huge st_size
-        def _huge_stat(path: str, *args: object, **kwargs: object) -> os.stat_result:
+        # Mock os.fstat to return huge st_size
+        def _huge_stat(fd: int, *args: object, **kwargs: object) -> os.stat_result:
             return os.stat_result(
                 (
                     real_stat.st_mode,
@@ -65,7 +65,7 @@ def test_process_file_size_limit() -> None:
                 )
             )
 
-        with patch("os.stat", side_effect=_huge_stat):
+        with patch("os.fstat", side_effect=_huge_stat):
             result = process_file(tmp_path, os.path.dirname(tmp_path), cfg, 0, 0)
             assert result.success is False
             assert result.error is not None